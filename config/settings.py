@@ -1,7 +1,43 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, EnvSettingsSource, PydanticBaseSettingsSource
 from pydantic import Field
-from typing import Optional, List
-import os
+from pydantic.fields import FieldInfo
+from typing import Any, Dict, Optional, List, Tuple
+from pathlib import Path
+import functools
+
+# Directories the application writes to, created by ensure_dirs()
+_REQUIRED_DIRS = ("data/resumes", "data/jobs", "data/applications", "logs")
+
+_VALID_RESUME_MODES = frozenset({"conservative", "moderate", "aggressive"})
+
+class LazyEnvSettingsSource(PydanticBaseSettingsSource):
+    """Env/.env source that only resolves the fields which are actually set
+    
+    The stock source runs field lookup and complex-value detection for every
+    field. Settings has no env prefix or aliases, so a field's variable name is
+    its (lower-cased) field name and unset fields can be skipped by intersecting
+    the field names with the loaded variables.
+    """
+    
+    def __init__(self, source: EnvSettingsSource):
+        super().__init__(source.settings_cls)
+        self.source = source
+        
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        return self.source.get_field_value(field, field_name)
+        
+    def __call__(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        fields = self.settings_cls.model_fields
+        
+        for field_name in fields.keys() & self.source.env_vars.keys():
+            field = fields[field_name]
+            value, field_key, value_is_complex = self.source.get_field_value(field, field_name)
+            value = self.source.prepare_field_value(field_name, field, value, value_is_complex)
+            if value is not None:
+                data[field_key] = value
+                
+        return data
 
 class Settings(BaseSettings):
     """Application Settings"""
@@ -49,36 +85,54 @@ class Settings(BaseSettings):
     max_log_size: str = Field(default="10MB")
     
     model_config = {"env_file": ".env", "extra": "ignore"}
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Resolve env and .env values only for the fields that are set"""
+        return (
+            init_settings,
+            LazyEnvSettingsSource(env_settings),
+            LazyEnvSettingsSource(dotenv_settings),
+            file_secret_settings,
+        )
 
-# Global settings instance
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings instance, loading it on first use"""
+    return Settings()
+
+def __getattr__(name: str):
+    """Resolve `settings` lazily so `from config.settings import settings` keeps working"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Validation functions
 def validate_api_keys():
     """Validate that at least one LLM API key is configured"""
+    settings = get_settings()
     if not settings.openai_api_key and not settings.anthropic_api_key:
         raise ValueError("At least one LLM API key must be configured")
 
 def validate_resume_mode():
     """Validate resume tailoring mode"""
-    valid_modes = ["conservative", "moderate", "aggressive"]
-    if settings.resume_tailoring_mode not in valid_modes:
+    settings = get_settings()
+    if settings.resume_tailoring_mode not in _VALID_RESUME_MODES:
         raise ValueError(f"Invalid tailoring mode: {settings.resume_tailoring_mode}")
 
 def validate_settings():
     """Validate all settings"""
     validate_api_keys()
     validate_resume_mode()
-    
-    # Create necessary directories
-    os.makedirs("data/resumes", exist_ok=True)
-    os.makedirs("data/jobs", exist_ok=True)
-    os.makedirs("data/applications", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
 
-# Auto-validate on import
-try:
-    validate_settings()
-except Exception as e:
-    print(f"Warning: Settings validation failed: {e}")
-    print("Please check your configuration and API keys.") 
\ No newline at end of file
+def ensure_dirs():
+    """Create any missing required directories"""
+    for directory in _REQUIRED_DIRS:
+        Path(directory).mkdir(parents=True, exist_ok=True)
@@ -5,7 +5,7 @@ AutoApply - Automated Job Application System
 Main entry point for the application.
 """
 
-import asyncio
+import functools
 import sys
 import os
 from pathlib import Path
@@ -14,36 +14,45 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
 
-from autoapply.models import Job, Resume, Application
-from config.settings import settings, validate_settings
+# Rich, the models and the settings are imported inside the commands that use
+# them so that `--help` and other light invocations don't pay for them.
 
-# Initialize Rich console
-console = Console()
+@functools.lru_cache(maxsize=1)
+def get_console():
+    """Get the shared Rich console, creating it on first use"""
+    from rich.console import Console
+    return Console()
 
-# Create Typer app
-app = typer.Typer(
-    name="autoapply",
-    help="AutoApply - Automated Job Application System",
-    add_completion=False
-)
+def make_app() -> typer.Typer:
+    """Create the Typer app and register the CLI commands"""
+    app = typer.Typer(
+        name="autoapply",
+        help="AutoApply - Automated Job Application System",
+        add_completion=False
+    )
+    for command in (init, web, status, upload_resume, apply, search, config):
+        app.command()(command)
+    return app
 
 def print_banner():
     """Print the application banner"""
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    console = get_console()
     banner = Text.from_markup("""
 [bold blue]AutoApply[/bold blue] - Automated Job Application System
 [dim]Streamline your job search with AI-powered automation[/dim]
 """)
     console.print(Panel(banner, style="blue"))
 
-@app.command()
 def init():
     """Initialize the AutoApply system"""
+    from config.settings import ensure_dirs, validate_settings
+    
     print_banner()
+    console = get_console()
     
     console.print("[bold green]Initializing AutoApply system...[/bold green]")
     
@@ -63,10 +72,7 @@ def init():
     
     # Create directories
     console.print("[blue]Creating directories...[/blue]")
-    os.makedirs("data/resumes", exist_ok=True)
-    os.makedirs("data/jobs", exist_ok=True)
-    os.makedirs("data/applications", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
+    ensure_dirs()
     
     console.print("[green]✓ AutoApply system initialized successfully![/green]")
     console.print("\n[bold]Next steps:[/bold]")
@@ -74,7 +80,6 @@ def init():
     console.print("2. Upload your resume: [code]python main.py upload-resume[/code]")
     console.print("3. Start the web interface: [code]python main.py web[/code]")
 
-@app.command()
 def web(
     host: str = typer.Option("127.0.0.1", help="Host to bind to"),
     port: int = typer.Option(8000, help="Port to bind to"),
@@ -82,6 +87,7 @@ def web(
 ):
     """Start the web interface"""
     print_banner()
+    console = get_console()
     
     console.print(f"[bold blue]Starting web interface on {host}:{port}[/bold blue]")
     
@@ -101,9 +107,11 @@ def web(
     except Exception as e:
         console.print(f"[red]Error starting web interface: {e}[/red]")
 
-@app.command()
 def status():
     """Show system status"""
+    from rich.table import Table
+    from config.settings import get_settings, validate_settings
+    
     print_banner()
     
     # Create status table
@@ -120,16 +128,21 @@ def status():
         table.add_row("Settings", "✗ Invalid", str(e))
     
     # Check directories
-    dirs_ok = all(os.path.exists(d) for d in ["data/resumes", "data/jobs", "data/applications", "logs"])
+    try:
+        with os.scandir("data") as entries:
+            data_dirs = {entry.name for entry in entries if entry.is_dir()}
+        dirs_ok = {"resumes", "jobs", "applications"} <= data_dirs and os.path.isdir("logs")
+    except OSError:
+        dirs_ok = False
     table.add_row("Directories", "✓ Present" if dirs_ok else "✗ Missing", "All required directories exist")
     
     # Check API keys
+    settings = get_settings()
     api_keys_ok = bool(settings.openai_api_key or settings.anthropic_api_key)
     table.add_row("API Keys", "✓ Configured" if api_keys_ok else "✗ Missing", "LLM API keys available")
     
-    console.print(table)
+    get_console().print(table)
 
-@app.command()
 def upload_resume(
     file_path: str = typer.Argument(..., help="Path to resume file"),
     name: str = typer.Option(None, help="Name for the resume"),
@@ -137,6 +150,7 @@ def upload_resume(
 ):
     """Upload a resume file"""
     print_banner()
+    console = get_console()
     
     console.print(f"[blue]Uploading resume: {file_path}[/blue]")
     
@@ -148,13 +162,13 @@ def upload_resume(
     console.print("[yellow]Resume upload functionality will be implemented in the next phase[/yellow]")
     console.print(f"[green]Resume would be uploaded from: {file_path}[/green]")
 
-@app.command()
 def apply(
     job_url: str = typer.Argument(..., help="Job posting URL"),
     test_mode: bool = typer.Option(True, help="Run in test mode (no actual application)")
 ):
     """Apply to a specific job"""
     print_banner()
+    console = get_console()
     
     console.print(f"[blue]Processing job application for: {job_url}[/blue]")
     
@@ -164,7 +178,6 @@ def apply(
     # TODO: Implement job application logic
     console.print("[yellow]Job application functionality will be implemented in the next phase[/yellow]")
 
-@app.command()
 def search(
     keywords: str = typer.Option(None, help="Job search keywords"),
     location: str = typer.Option(None, help="Job location"),
@@ -172,6 +185,7 @@ def search(
 ):
     """Search for jobs"""
     print_banner()
+    console = get_console()
     
     console.print(f"[blue]Searching for jobs on {platform}[/blue]")
     
@@ -183,13 +197,13 @@ def search(
     # TODO: Implement job search logic
     console.print("[yellow]Job search functionality will be implemented in the next phase[/yellow]")
 
-@app.command()
 def config(
     key: str = typer.Option(None, help="Configuration key to view/set"),
     value: str = typer.Option(None, help="New value for the configuration key")
 ):
     """View or modify configuration"""
     print_banner()
+    console = get_console()
     
     if key and value:
         console.print(f"[blue]Setting {key} = {value}[/blue]")
@@ -200,6 +214,9 @@ def config(
         # TODO: Implement config viewing
         console.print("[yellow]Configuration viewing will be implemented in the next phase[/yellow]")
     else:
+        from config.settings import get_settings
+        
+        settings = get_settings()
         console.print("[blue]Current configuration:[/blue]")
         console.print(f"Test Mode: {settings.test_mode}")
         console.print(f"Max Applications/Day: {settings.max_concurrent_applications}")
@@ -249,8 +266,9 @@ LOG_FILE=autoapply.log
     with open(".env", "w") as f:
         f.write(template_content)
     
+    console = get_console()
     console.print("[green]✓ .env template created[/green]")
     console.print("[yellow]Please edit .env file with your API keys and preferences[/yellow]")
 
 if __name__ == "__main__":
-    app() 
\ No newline at end of file
+    make_app()() 
\ No newline at end of file
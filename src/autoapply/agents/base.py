@@ -1,14 +1,42 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, TypeVar, Generic
 from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
-import asyncio
+from collections import deque
+from functools import cached_property, singledispatch
+from itertools import islice
 import logging
+import time
+
+if TYPE_CHECKING:
+    import asyncio
 
 # Generic type for agent input/output
 T = TypeVar('T')
 
+# Parent logger for all agents; per-agent child loggers are created on first use
+_LOGGER = logging.getLogger("autoapply.agents")
+
+@singledispatch
+def _summarize_input(input_data: Any) -> str:
+    """Create a summary of input data for logging"""
+    if hasattr(input_data, '__dict__'):
+        return f"{type(input_data).__name__} object"
+    return type(input_data).__name__
+
+@_summarize_input.register(dict)
+def _(input_data: dict) -> str:
+    # Only list the first few keys of large dicts
+    summary = f"Dict with keys: {list(islice(input_data, 8))}"
+    if len(input_data) > 8:
+        summary += f" (+{len(input_data) - 8} more)"
+    return summary
+
+@_summarize_input.register(list)
+def _(input_data: list) -> str:
+    return f"List with {len(input_data)} items"
+
 class AgentStatus(str, Enum):
     """Agent execution status"""
     IDLE = "idle"
@@ -25,22 +53,28 @@ class AgentResult(BaseModel, Generic[T]):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     execution_time: float = Field(0.0, description="Execution time in seconds")
     
+    # The factories below assemble every field themselves, so they skip validation;
+    # use model_validate for results coming from outside (e.g. deserialized JSON).
     @classmethod
     def success_result(cls, data: T, metadata: Dict[str, Any] = None) -> 'AgentResult[T]':
         """Create a successful result"""
-        return cls(
+        return cls.model_construct(
             success=True,
             data=data,
-            metadata=metadata or {}
+            error=None,
+            metadata=metadata or {},
+            execution_time=0.0
         )
         
     @classmethod
     def failure_result(cls, error: str, metadata: Dict[str, Any] = None) -> 'AgentResult[T]':
         """Create a failed result"""
-        return cls(
+        return cls.model_construct(
             success=False,
+            data=None,
             error=error,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            execution_time=0.0
         )
 
 class BaseAgent(ABC):
@@ -50,8 +84,18 @@ class BaseAgent(ABC):
         self.name = name
         self.config = config or {}
         self.status = AgentStatus.IDLE
-        self.logger = logging.getLogger(f"autoapply.agents.{name}")
-        self.execution_history: List[Dict[str, Any]] = []
+        # Keep only last 100 executions
+        self.execution_history: Deque[Dict[str, Any]] = deque(maxlen=100)
+        
+        # Running aggregates over execution_history for get_performance_metrics
+        self._total_execution_time = 0.0
+        self._successful_executions = 0
+        self._successful_execution_time = 0.0
+        
+    @cached_property
+    def logger(self) -> logging.Logger:
+        """Logger for this agent, created the first time the agent logs"""
+        return _LOGGER.getChild(self.name)
         
     @abstractmethod
     async def execute(self, input_data: Any) -> AgentResult:
@@ -65,7 +109,7 @@ class BaseAgent(ABC):
         
     async def run(self, input_data: Any) -> AgentResult:
         """Run the agent with proper error handling and status management"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             # Validate input
@@ -80,7 +124,7 @@ class BaseAgent(ABC):
             result = await self.execute(input_data)
             
             # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             result.execution_time = execution_time
             
             # Update status
@@ -94,7 +138,7 @@ class BaseAgent(ABC):
         except Exception as e:
             self.logger.error(f"Agent {self.name} failed with error: {str(e)}")
             self.status = AgentStatus.FAILED
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             result = AgentResult.failure_result(str(e))
             result.execution_time = execution_time
@@ -113,22 +157,24 @@ class BaseAgent(ABC):
             "metadata": result.metadata
         }
         
+        # The deque drops its oldest record on append once full
+        if len(self.execution_history) == self.execution_history.maxlen:
+            self._update_aggregates(self.execution_history[0], -1)
+            
         self.execution_history.append(execution_record)
-        
-        # Keep only last 100 executions
-        if len(self.execution_history) > 100:
-            self.execution_history = self.execution_history[-100:]
+        self._update_aggregates(execution_record, 1)
+            
+    def _update_aggregates(self, execution_record: Dict[str, Any], sign: int):
+        """Add (sign=1) or remove (sign=-1) a record's contribution to the running aggregates"""
+        execution_time = execution_record["execution_time"] * sign
+        self._total_execution_time += execution_time
+        if execution_record["success"]:
+            self._successful_executions += sign
+            self._successful_execution_time += execution_time
             
     def _summarize_input(self, input_data: Any) -> str:
         """Create a summary of input data for logging"""
-        if isinstance(input_data, dict):
-            return f"Dict with keys: {list(input_data.keys())}"
-        elif isinstance(input_data, list):
-            return f"List with {len(input_data)} items"
-        elif hasattr(input_data, '__dict__'):
-            return f"{type(input_data).__name__} object"
-        else:
-            return str(type(input_data).__name__)
+        return _summarize_input(input_data)
             
     def get_status(self) -> AgentStatus:
         """Get current agent status"""
@@ -136,7 +182,7 @@ class BaseAgent(ABC):
         
     def get_execution_history(self) -> List[Dict[str, Any]]:
         """Get execution history"""
-        return self.execution_history.copy()
+        return list(self.execution_history)
         
     def reset(self):
         """Reset agent to idle state"""
@@ -156,23 +202,23 @@ class BaseAgent(ABC):
         
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get performance metrics"""
-        if not self.execution_history:
+        total_executions = len(self.execution_history)
+        if not total_executions:
             return {}
             
-        successful_executions = [ex for ex in self.execution_history if ex['success']]
-        failed_executions = [ex for ex in self.execution_history if not ex['success']]
+        successful_executions = self._successful_executions
         
         metrics = {
-            "total_executions": len(self.execution_history),
-            "successful_executions": len(successful_executions),
-            "failed_executions": len(failed_executions),
-            "success_rate": len(successful_executions) / len(self.execution_history) * 100,
-            "average_execution_time": sum(ex['execution_time'] for ex in self.execution_history) / len(self.execution_history),
-            "last_execution": self.execution_history[-1]['timestamp'] if self.execution_history else None
+            "total_executions": total_executions,
+            "successful_executions": successful_executions,
+            "failed_executions": total_executions - successful_executions,
+            "success_rate": successful_executions / total_executions * 100,
+            "average_execution_time": self._total_execution_time / total_executions,
+            "last_execution": self.execution_history[-1]['timestamp']
         }
         
         if successful_executions:
-            metrics["average_successful_execution_time"] = sum(ex['execution_time'] for ex in successful_executions) / len(successful_executions)
+            metrics["average_successful_execution_time"] = self._successful_execution_time / successful_executions
             
         return metrics
 
@@ -181,27 +227,70 @@ class AsyncAgent(BaseAgent):
     
     def __init__(self, name: str, config: Dict[str, Any] = None):
         super().__init__(name, config)
-        self._tasks: List[asyncio.Task] = []
+        self._tasks: List['asyncio.Task'] = []
         
-    async def execute_parallel(self, tasks: List[Any]) -> List[AgentResult]:
-        """Execute multiple tasks in parallel"""
-        async def run_task(task_data):
-            return await self.run(task_data)
+    async def execute_parallel(self, tasks: List[Any], max_concurrency: int = 32) -> List[AgentResult]:
+        """Execute multiple tasks in parallel, at most max_concurrency at a time
+        
+        Tasks call execute() directly instead of run(), so the agent status and
+        execution history are updated once for the whole batch rather than per task.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if not tasks:
+            return []
             
-        results = await asyncio.gather(*[run_task(task) for task in tasks], return_exceptions=True)
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # Convert exceptions to failed results
-        processed_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                processed_results.append(AgentResult.failure_result(str(result)))
-            else:
-                processed_results.append(result)
+        async def run_task(task_data):
+            async with semaphore:
+                start_time = time.perf_counter()
+                try:
+                    if self.validate_input(task_data):
+                        result = await self.execute(task_data)
+                    else:
+                        result = AgentResult.failure_result("Invalid input data")
+                except Exception as e:
+                    self.logger.error(f"Agent {self.name} task failed with error: {str(e)}")
+                    result = AgentResult.failure_result(str(e))
+                result.execution_time = time.perf_counter() - start_time
+                return result
                 
-        return processed_results
+        start_time = time.perf_counter()
+        self.status = AgentStatus.RUNNING
+        self.logger.info(f"Starting parallel execution of {len(tasks)} tasks for agent: {self.name}")
+        
+        # run_task never raises, so one failing task doesn't cancel the group
+        async with asyncio.TaskGroup() as task_group:
+            running_tasks = [task_group.create_task(run_task(task)) for task in tasks]
+        results = [task.result() for task in running_tasks]
+        
+        # Record one aggregated execution for the batch
+        execution_time = time.perf_counter() - start_time
+        successful_tasks = sum(1 for result in results if result.success)
+        failed_tasks = len(results) - successful_tasks
+        batch_result = AgentResult.model_construct(
+            success=failed_tasks == 0,
+            data=None,
+            error=f"{failed_tasks} of {len(results)} tasks failed" if failed_tasks else None,
+            metadata={
+                "total_tasks": len(results),
+                "successful_tasks": successful_tasks,
+                "failed_tasks": failed_tasks
+            },
+            execution_time=execution_time
+        )
+        self.status = AgentStatus.COMPLETED if batch_result.success else AgentStatus.FAILED
+        self._log_execution(tasks, batch_result, execution_time)
+        
+        return results
         
     async def cleanup(self):
         """Clean up any running tasks"""
+        import asyncio
+        
         for task in self._tasks:
             if not task.done():
                 task.cancel()
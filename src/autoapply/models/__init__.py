@@ -1,17 +1,23 @@
-from .job import Job, JobRequirement, JobStatus
-from .resume import Resume, ResumeSection, ResumeTailoringMode
+from .job import Job, JobIn, JobLite, JobRequirement, JobStatus, RequirementImportance
+from .resume import Resume, ResumeSection, ResumeSectionLite, ResumeTailoringMode
 from .application import Application, ApplicationStatus, ApplicationPlatform
-from .user import User, UserProfile
+from .user import User, UserIn, UserProfile, UserProfileIn
+from .corpus import JobCorpus
 
 __all__ = [
     # Job models
     "Job",
+    "JobIn",
+    "JobLite",
     "JobRequirement", 
     "JobStatus",
+    "RequirementImportance",
+    "JobCorpus",
     
     # Resume models
     "Resume",
     "ResumeSection",
+    "ResumeSectionLite",
     "ResumeTailoringMode",
     
     # Application models
@@ -21,5 +27,7 @@ __all__ = [
     
     # User models
     "User",
+    "UserIn",
     "UserProfile",
+    "UserProfileIn",
 ] 
\ No newline at end of file
@@ -1,7 +1,12 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import Optional, Dict, Any, Iterator, List, Mapping, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
 from enum import Enum
+from types import MappingProxyType
+
+from .base import CacheAwareModel
 
 class ApplicationStatus(str, Enum):
     """Application status tracking"""
@@ -23,13 +28,35 @@ class ApplicationPlatform(str, Enum):
     RECRUITER = "recruiter"
     OTHER = "other"
 
-class ApplicationFormData(BaseModel):
+# Statuses for which an application is still in progress
+_ACTIVE_STATUSES = frozenset({
+    ApplicationStatus.PENDING,
+    ApplicationStatus.SUBMITTED,
+    ApplicationStatus.UNDER_REVIEW,
+    ApplicationStatus.INTERVIEW_SCHEDULED
+})
+
+# Days after submission before a follow-up is due, by status
+_FOLLOW_UP_DAYS = {
+    ApplicationStatus.SUBMITTED: 7,
+    ApplicationStatus.UNDER_REVIEW: 14
+}
+
+@dataclass(slots=True, frozen=True)
+class ApplicationFormData:
     """Form data submitted with application"""
-    field_name: str = Field(..., description="Form field name")
-    field_value: str = Field(..., description="Value entered")
-    field_type: str = Field(..., description="Type of field (text, dropdown, etc.)")
+    field_name: str  # Form field name
+    field_value: str  # Value entered
+    field_type: str = "text"  # Type of field (text, dropdown, etc.)
 
-class Application(BaseModel):
+class StatusChange(BaseModel):
+    """Entry in an application's status history"""
+    from_status: str = Field(..., description="Status value before the change")
+    to_status: str = Field(..., description="Status value after the change")
+    timestamp: str = Field(..., description="When the change happened (ISO format)")
+    notes: Optional[str] = Field(None, description="Notes about the change")
+
+class Application(CacheAwareModel):
     """Job application data model"""
     
     # Basic Information
@@ -43,7 +70,7 @@ class Application(BaseModel):
     
     # Status Tracking
     status: ApplicationStatus = Field(default=ApplicationStatus.PENDING, description="Current application status")
-    status_history: List[Dict[str, Any]] = Field(default_factory=list, description="History of status changes")
+    status_history: List[StatusChange] = Field(default_factory=list, description="History of status changes")
     
     # Application Content
     cover_letter: Optional[str] = Field(None, description="Cover letter content")
@@ -73,20 +100,69 @@ class Application(BaseModel):
     errors: List[str] = Field(default_factory=list, description="Any errors that occurred")
     retry_count: int = Field(default=0, description="Number of retry attempts")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # Datetimes are serialized as ISO 8601 by pydantic's core serializer
+    model_config = ConfigDict(validate_assignment=False)
+    
+    # Set while inside batch_update() to defer updated_at writes
+    _batching: bool = PrivateAttr(default=False)
+    
+    # In-memory cache for get_form_data_dict, the form_data list it was built from
+    # and the number of entries it covers
+    _form_data_dict: Optional[Dict[str, str]] = PrivateAttr(default=None)
+    _form_data_src: Optional[List[ApplicationFormData]] = PrivateAttr(default=None)
+    _form_data_cached: int = PrivateAttr(default=0)
+    
+    # ((today, submitted_at), days) for days_since_submission
+    _days_since_submission: Optional[Tuple[Tuple[date, datetime], int]] = PrivateAttr(default=None)
+    
+    @contextmanager
+    def batch_update(self) -> Iterator['Application']:
+        """Group several mutations so updated_at is written once, on exit
+        
+        Usage:
+            with application.batch_update():
+                for name, value in fields:
+                    application.add_form_data(name, value)
+        """
+        if self._batching:
+            yield self
+            return
+            
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self.updated_at = datetime.now()
+            
+    def _touch(self):
+        """Record a modification unless a batch update is in progress"""
+        if not self._batching:
+            self.updated_at = datetime.now()
+        
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (for storage writes)
+        
+        Same output as model_dump_json(), taken straight from the core
+        serializer without decoding to str.
+        """
+        return self.__pydantic_serializer__.to_json(self)
         
     def add_form_data(self, field_name: str, field_value: str, field_type: str = "text"):
         """Add form field data"""
-        form_data = ApplicationFormData(
-            field_name=field_name,
-            field_value=field_value,
-            field_type=field_type
-        )
-        self.form_data.append(form_data)
-        self.updated_at = datetime.now()
+        entries = self.form_data
+        entries.append(ApplicationFormData(field_name, field_value, field_type))
+        
+        # Keep an up-to-date cache current instead of rebuilding it later
+        private = self.__pydantic_private__
+        if (
+            private["_form_data_dict"] is not None
+            and private["_form_data_src"] is entries
+            and private["_form_data_cached"] == len(entries) - 1
+        ):
+            private["_form_data_dict"][field_name] = field_value
+            private["_form_data_cached"] += 1
+        self._touch()
         
     def update_status(self, new_status: ApplicationStatus, notes: Optional[str] = None):
         """Update application status with history tracking"""
@@ -94,14 +170,14 @@ class Application(BaseModel):
         self.status = new_status
         
         # Add to history
-        status_change = {
-            "from_status": old_status,
-            "to_status": new_status,
-            "timestamp": datetime.now().isoformat(),
-            "notes": notes
-        }
+        status_change = StatusChange.model_construct(
+            from_status=old_status.value,
+            to_status=new_status.value,
+            timestamp=datetime.now().isoformat(),
+            notes=notes
+        )
         self.status_history.append(status_change)
-        self.updated_at = datetime.now()
+        self._touch()
         
     def mark_submitted(self, confirmation_number: Optional[str] = None):
         """Mark application as submitted"""
@@ -123,18 +199,25 @@ class Application(BaseModel):
         """Add error to application"""
         self.errors.append(f"{datetime.now().isoformat()}: {error_message}")
         self.retry_count += 1
-        self.updated_at = datetime.now()
+        self._touch()
         
-    def get_form_data_dict(self) -> Dict[str, str]:
-        """Get form data as dictionary"""
-        return {field.field_name: field.field_value for field in self.form_data}
+    def get_form_data_dict(self) -> Mapping[str, str]:
+        """Get form data as a read-only mapping (cached; copy with dict() to modify)"""
+        private = self.__pydantic_private__
+        entries = self.form_data
+        cached = private["_form_data_dict"]
+        if cached is None or private["_form_data_src"] is not entries or private["_form_data_cached"] != len(entries):
+            cached = private["_form_data_dict"] = {field.field_name: field.field_value for field in entries}
+            private["_form_data_src"] = entries
+            private["_form_data_cached"] = len(entries)
+        return MappingProxyType(cached)
         
     def get_status_summary(self) -> Dict[str, Any]:
         """Get application status summary"""
         return {
             "current_status": self.status,
             "submitted_at": self.submitted_at,
-            "days_since_submission": (datetime.now() - self.submitted_at).days if self.submitted_at else None,
+            "days_since_submission": self.days_since_submission,
             "status_changes": len(self.status_history),
             "has_errors": len(self.errors) > 0,
             "retry_count": self.retry_count,
@@ -143,23 +226,25 @@ class Application(BaseModel):
         
     def is_active(self) -> bool:
         """Check if application is still active (not rejected, accepted, or withdrawn)"""
-        return self.status in [
-            ApplicationStatus.PENDING,
-            ApplicationStatus.SUBMITTED,
-            ApplicationStatus.UNDER_REVIEW,
-            ApplicationStatus.INTERVIEW_SCHEDULED
-        ]
+        return self.status in _ACTIVE_STATUSES
+        
+    @property
+    def days_since_submission(self) -> Optional[int]:
+        """Calendar days since submission, cached for the current day"""
+        if not self.submitted_at:
+            return None
+            
+        key = (date.today(), self.submitted_at)
+        private = self.__pydantic_private__
+        cached = private["_days_since_submission"]
+        if cached is None or cached[0] != key:
+            cached = private["_days_since_submission"] = (key, (key[0] - self.submitted_at.date()).days)
+        return cached[1]
         
     def requires_follow_up(self) -> bool:
         """Check if application requires follow-up"""
-        if not self.submitted_at:
+        follow_up_days = _FOLLOW_UP_DAYS.get(self.status)
+        if follow_up_days is None or not self.submitted_at:
             return False
             
-        days_since_submission = (datetime.now() - self.submitted_at).days
-        return (
-            self.status == ApplicationStatus.SUBMITTED and 
-            days_since_submission > 7
-        ) or (
-            self.status == ApplicationStatus.UNDER_REVIEW and 
-            days_since_submission > 14
-        ) 
\ No newline at end of file
+        return self.days_since_submission > follow_up_days
@@ -0,0 +1,201 @@
+from pydantic import BaseModel, GetJsonSchemaHandler, PrivateAttr, TypeAdapter, computed_field, model_validator
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Type
+from datetime import datetime
+from types import MappingProxyType
+from functools import lru_cache
+import orjson
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Get a (cached) TypeAdapter for List[model], for one-call batch serialization"""
+    return TypeAdapter(List[model])
+
+def parse_datetimes(data: Dict[str, Any], names: Iterable[str]) -> None:
+    """Convert ISO datetime strings under the given keys in place"""
+    for name in names:
+        value = data.get(name)
+        if isinstance(value, str):
+            data[name] = datetime.fromisoformat(value)
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _encode_metadata(value: Any) -> Optional[bytes]:
+    """Encode metadata (a dict, or already-encoded JSON) to compact bytes; None if empty"""
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    if not isinstance(value, dict):
+        raise ValueError("metadata must be a dict")
+    try:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as exc:
+        raise ValueError(f"metadata is not JSON serializable: {exc}") from exc
+
+class CacheAwareModel(BaseModel):
+    """Base for models whose private attributes only hold derived caches
+    
+    Equality compares fields (and extras) only, so building a cache does not
+    make a model unequal to an otherwise identical copy. Hot paths read
+    `self.__pydantic_private__` directly, since pydantic's `__getattr__`
+    fallback for private attributes is slow.
+    """
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+class CachedSummaryModel(CacheAwareModel):
+    """Base for models with a `summary` built from their fields
+    
+    Subclasses implement `_build_summary`. The result is cached as a read-only
+    mapping, shared by every caller, until the model is next assigned to.
+    """
+    
+    _summary: Optional[Mapping[str, Any]] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any):
+        # Any assignment may change the summary
+        self.__pydantic_private__["_summary"] = None
+        super().__setattr__(name, value)
+        
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> Any:
+        # update= writes the copy's __dict__ directly, bypassing __setattr__
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__pydantic_private__["_summary"] = None
+        return copied
+        
+    @property
+    def summary(self) -> Mapping[str, Any]:
+        """Cached summary, rebuilt after the next assignment"""
+        summary = self.__pydantic_private__["_summary"]
+        if summary is None:
+            summary = self._rebuild_summary()
+        return summary
+        
+    def _rebuild_summary(self) -> Mapping[str, Any]:
+        summary = self.__pydantic_private__["_summary"] = MappingProxyType(self._build_summary())
+        return summary
+        
+    def _build_summary(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+class LazyMetadataModel(CacheAwareModel):
+    """Base for models with a free-form `metadata` dict that is rarely read
+    
+    Metadata is held as compact orjson bytes and only decoded into a dict on
+    first access. It still validates from and serializes to a plain
+    `metadata` key; input may be a dict or already-encoded JSON bytes.
+    """
+    
+    _metadata_raw: Optional[bytes] = PrivateAttr(default=None)
+    _metadata: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    @model_validator(mode="wrap")
+    @classmethod
+    def _split_metadata(cls, data: Any, handler: Any) -> Any:
+        if not isinstance(data, dict) or "metadata" not in data:
+            return handler(data)
+            
+        data = dict(data)
+        metadata = data.pop("metadata")
+        raw = _encode_metadata(metadata)
+        if raw is not None and not isinstance(metadata, dict) and not isinstance(orjson.loads(raw), dict):
+            raise ValueError("metadata must be a JSON object")
+        model = handler(data)
+        model.__pydantic_private__["_metadata_raw"] = raw
+        return model
+        
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        json_schema = handler(core_schema)
+        # metadata is split off before field validation, so it has no validation
+        # field of its own; document it as an input property anyway
+        if handler.mode == "validation":
+            properties = handler.resolve_ref_schema(json_schema).setdefault("properties", {})
+            properties["metadata"] = {
+                "title": "Metadata",
+                "description": "Additional metadata",
+                "type": "object",
+            }
+        return json_schema
+        
+    def __eq__(self, other: Any) -> bool:
+        # Compare decoded metadata; the raw bytes depend on key order and the
+        # decoded dict is only a cache of them
+        equal = super().__eq__(other)
+        if equal is not True:
+            return equal
+        return self._decoded_metadata() == other._decoded_metadata()
+        
+    def _decoded_metadata(self) -> Dict[str, Any]:
+        """Current metadata as a dict, without caching the decode"""
+        private = self.__pydantic_private__
+        metadata = private["_metadata"]
+        if metadata is not None:
+            return metadata
+        raw = private["_metadata_raw"]
+        return orjson.loads(raw) if raw else {}
+        
+    @classmethod
+    def model_construct(cls, _fields_set: Optional[set] = None, **values: Any) -> Any:
+        metadata = values.pop("metadata", None)
+        model = super().model_construct(_fields_set, **values)
+        if metadata:
+            model.__pydantic_private__["_metadata_raw"] = _encode_metadata(metadata)
+        return model
+        
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> Any:
+        # metadata is not a field; route an update of it to the private state
+        if update and "metadata" in update:
+            update = dict(update)
+            metadata = update.pop("metadata")
+            copy = super().model_copy(update=update, deep=deep)
+            copy.metadata = metadata
+            return copy
+        return super().model_copy(update=update, deep=deep)
+        
+    @computed_field(description="Additional metadata")
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional metadata (decoded on first access)"""
+        private = self.__pydantic_private__
+        metadata = private["_metadata"]
+        if metadata is None:
+            raw = private["_metadata_raw"]
+            metadata = private["_metadata"] = orjson.loads(raw) if raw else {}
+        return metadata
+        
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        # Stored encoded, so later changes to `value` itself are not picked up
+        private = self.__pydantic_private__
+        private["_metadata_raw"] = _encode_metadata(value)
+        private["_metadata"] = None
+        
+    @property
+    def metadata_raw(self) -> Optional[bytes]:
+        """Metadata as JSON bytes (None if empty), e.g. for storage or copying"""
+        private = self.__pydantic_private__
+        metadata = private["_metadata"]
+        if metadata is not None:
+            return _encode_metadata(metadata)
+        return private["_metadata_raw"]
+        
+    def metadata_get(self, key: str, default: Any = None) -> Any:
+        """Get one metadata value"""
+        return self.metadata.get(key, default)
@@ -0,0 +1,61 @@
+from typing import List, Dict, Iterable, Union
+from math import sqrt
+
+from .job import Job, JobLite
+
+class JobCorpus:
+    """Skill-overlap scoring for many jobs against one set of user skills
+    
+    Each job's key skills are encoded once as an int bitmask over a shared,
+    case-insensitive skill vocabulary, so scoring a job is an AND plus a
+    popcount instead of a set intersection.
+    """
+    
+    def __init__(self, jobs: Iterable[Union[Job, JobLite]]):
+        self.jobs: List[Union[Job, JobLite]] = list(jobs)
+        self.skills_vocab: Dict[str, int] = {}
+        self._masks: List[int] = [self._encode(job.key_skills) for job in self.jobs]
+        self._sizes: List[int] = [mask.bit_count() for mask in self._masks]
+        
+    def _encode(self, skills: Iterable[str]) -> int:
+        """Bitmask for skills, growing the vocabulary as needed"""
+        vocab = self.skills_vocab
+        mask = 0
+        for skill in skills:
+            key = skill.lower()
+            bit = vocab.get(key)
+            if bit is None:
+                bit = vocab[key] = len(vocab)
+            mask |= 1 << bit
+        return mask
+        
+    def score_all(self, user_skills: Iterable[str]) -> List[float]:
+        """Cosine similarity (0-1) between the user's skills and each job's key skills"""
+        user = {skill.lower() for skill in user_skills}
+        if not user:
+            return [0.0] * len(self.jobs)
+        
+        # Skills outside the vocabulary can't overlap but still count towards |user|
+        vocab = self.skills_vocab
+        user_mask = 0
+        for skill in user:
+            bit = vocab.get(skill)
+            if bit is not None:
+                user_mask |= 1 << bit
+        user_size = len(user)
+        
+        return [
+            (mask & user_mask).bit_count() / sqrt(size * user_size) if size else 0.0
+            for mask, size in zip(self._masks, self._sizes)
+        ]
+        
+    def apply_scores(self, user_skills: Iterable[str]) -> List[float]:
+        """Score every job and store the result on Job.match_score
+        
+        JobLite views are immutable and are skipped; use score_all for those.
+        """
+        scores = self.score_all(user_skills)
+        for job, score in zip(self.jobs, scores):
+            if isinstance(job, Job):
+                job.match_score = score
+        return scores
@@ -1,7 +1,14 @@
-from pydantic import BaseModel, Field, HttpUrl
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, field_validator
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+import os
+import sys
+
+from ..utils.time import now
+from .base import LazyMetadataModel, list_adapter, parse_datetimes
 
 class JobStatus(str, Enum):
     """Job posting status"""
@@ -11,14 +18,187 @@ class JobStatus(str, Enum):
     REJECTED = "rejected"
     EXPIRED = "expired"
 
+class RequirementImportance(str, Enum):
+    """How strongly a job requirement is weighted"""
+    REQUIRED = "required"
+    PREFERRED = "preferred"
+    NICE_TO_HAVE = "nice-to-have"
+
+def _intern(value: Any) -> Any:
+    """Intern closed-vocabulary strings so repeated values share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+_EMPLOYMENT_TYPE_SYNONYMS = {
+    "fulltime": "full-time",
+    "parttime": "part-time",
+    "contractor": "contract",
+    "intern": "internship",
+    "temp": "temporary",
+}
+
+_EXPERIENCE_LEVEL_SYNONYMS = {
+    "entry-level": "entry",
+    "junior": "entry",
+    "jr": "entry",
+    "mid-level": "mid",
+    "intermediate": "mid",
+    "senior-level": "senior",
+    "sr": "senior",
+}
+
+def _slug(value: str, sep: str) -> str:
+    """Lower-case and join words split on whitespace, '-' or '_' with `sep`"""
+    return sep.join(value.lower().replace("_", " ").replace("-", " ").split())
+
+@lru_cache(maxsize=64)
+def _normalize_employment_type(value: str) -> str:
+    """'Full Time' / 'FULL_TIME' / 'fulltime' -> 'full-time'"""
+    key = _slug(value, "-")
+    return sys.intern(_EMPLOYMENT_TYPE_SYNONYMS.get(key, key))
+
+@lru_cache(maxsize=64)
+def _normalize_experience_level(value: str) -> str:
+    """'Entry Level' / 'Junior' -> 'entry', 'Mid-Level' -> 'mid', 'Sr' -> 'senior'"""
+    key = _slug(value, "-")
+    return sys.intern(_EXPERIENCE_LEVEL_SYNONYMS.get(key, key))
+
+@lru_cache(maxsize=64)
+def _normalize_platform(value: str) -> str:
+    """'LinkedIn' -> 'linkedin', 'Company Website' -> 'company_website'"""
+    return sys.intern(_slug(value, "_"))
+
 class JobRequirement(BaseModel):
     """Individual job requirement"""
     category: str = Field(..., description="Category of requirement (e.g., 'technical', 'experience', 'education')")
     skill: str = Field(..., description="Specific skill or requirement")
-    importance: str = Field(..., description="Importance level: 'required', 'preferred', 'nice-to-have'")
+    importance: RequirementImportance = Field(..., description="Importance level: 'required', 'preferred', 'nice-to-have'")
     years_experience: Optional[int] = Field(None, description="Years of experience required")
     
-class Job(BaseModel):
+    @field_validator("category", mode="before")
+    @classmethod
+    def _intern_category(cls, value: Any) -> Any:
+        return _intern(value)
+    
+    @classmethod
+    def from_trusted(cls, **data: Any) -> 'JobRequirement':
+        """Build a requirement from already-validated data without re-validating it
+        
+        `importance` may still be a plain string; it is coerced to
+        RequirementImportance (raising ValueError if unknown).
+        """
+        if "importance" in data:
+            data["importance"] = RequirementImportance(data["importance"])
+        return cls.model_construct(**data)
+    
+# Opt-in reuse of JobRequirement instances for bulk ingest (read once at import)
+_USE_POOL = os.environ.get("AUTOAPPLY_USE_POOL") == "1"
+_REQ_POOL: List[JobRequirement] = []
+_REQ_POOL_MAX = 4096
+_REQ_FIELDS = frozenset(("category", "skill", "importance", "years_experience"))
+
+def acquire_requirement(
+    category: str,
+    skill: str,
+    importance: str,
+    years_experience: Optional[int] = None
+) -> JobRequirement:
+    """Get a JobRequirement, reusing a released instance when pooling is enabled
+    
+    With AUTOAPPLY_USE_POOL=1 the instance skips field validation; importance is
+    still coerced to RequirementImportance (raising ValueError if unknown).
+    Without it this is plain validated construction.
+    """
+    if not _USE_POOL:
+        return JobRequirement(
+            category=category,
+            skill=skill,
+            importance=importance,
+            years_experience=years_experience
+        )
+        
+    values = {
+        "category": _intern(category),
+        "skill": skill,
+        "importance": RequirementImportance(importance),
+        "years_experience": years_experience
+    }
+    if not _REQ_POOL:
+        return JobRequirement.model_construct(**values)
+        
+    requirement = _REQ_POOL.pop()
+    requirement.__dict__.update(values)
+    object.__setattr__(requirement, "__pydantic_fields_set__", set(_REQ_FIELDS))
+    return requirement
+
+def release_requirement(requirement: JobRequirement) -> None:
+    """Return a requirement to the pool; the caller must not use it afterwards"""
+    if _USE_POOL and len(_REQ_POOL) < _REQ_POOL_MAX:
+        _REQ_POOL.append(requirement)
+
+@dataclass(slots=True, frozen=True)
+class JobLite:
+    """Read-only, slotted view of a job for retrieval and ranking over large corpora"""
+    id: Optional[str]
+    title: str
+    company: str
+    location: str
+    url: str
+    platform: str
+    description: str
+    key_skills: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    match_score: Optional[float]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the fields as a plain dict (skills/keywords stay tuples)"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "url": self.url,
+            "platform": self.platform,
+            "description": self.description,
+            "key_skills": self.key_skills,
+            "keywords": self.keywords,
+            "match_score": self.match_score
+        }
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'JobLite':
+        """Build from a to_dict()/Job.to_dict() style dict; extra keys are ignored"""
+        return cls(
+            data.get("id"),
+            data["title"],
+            data["company"],
+            data["location"],
+            str(data["url"]),
+            data["platform"],
+            data["description"],
+            tuple(data.get("key_skills", ())),
+            tuple(data.get("keywords", ())),
+            data.get("match_score")
+        )
+        
+    def to_model(self) -> 'Job':
+        """Convert back to a Job (fields not carried here get their defaults)"""
+        return Job.from_trusted(
+            id=self.id,
+            title=self.title,
+            company=self.company,
+            location=self.location,
+            url=self.url,
+            platform=self.platform,
+            description=self.description,
+            key_skills=list(self.key_skills),
+            keywords=list(self.keywords),
+            match_score=self.match_score
+        )
+    
+# Job datetime fields, stored as ISO strings in JSON rows
+_DATETIME_FIELDS = ("discovered_at", "analyzed_at", "applied_at")
+
+class Job(LazyMetadataModel):
     """Job posting data model"""
     
     # Basic Information
@@ -26,7 +206,7 @@ class Job(BaseModel):
     title: str = Field(..., description="Job title")
     company: str = Field(..., description="Company name")
     location: str = Field(..., description="Job location")
-    url: HttpUrl = Field(..., description="Job posting URL")
+    url: str = Field(..., description="Job posting URL")
     
     # Job Details
     description: str = Field(..., description="Full job description")
@@ -47,46 +227,175 @@ class Job(BaseModel):
     
     # Metadata
     status: JobStatus = Field(default=JobStatus.DISCOVERED, description="Current job status")
-    discovered_at: datetime = Field(default_factory=datetime.now, description="When job was discovered")
+    discovered_at: datetime = Field(default_factory=now, description="When job was discovered")
     analyzed_at: Optional[datetime] = Field(None, description="When job was analyzed")
     applied_at: Optional[datetime] = Field(None, description="When application was submitted")
     
     # Additional data
     company_info: Optional[Dict[str, Any]] = Field(None, description="Additional company information")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(ser_json_timedelta="iso8601", extra="ignore")
+    
+    # (required, preferred, nice-to-have) skills, plus the requirements list (and its
+    # length) they were built from
+    _req_cache: Optional[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]] = PrivateAttr(default=None)
+    _req_cache_src: Optional[List[JobRequirement]] = PrivateAttr(default=None)
+    _req_cache_len: int = PrivateAttr(default=0)
+    
+    @field_validator("platform", mode="before")
+    @classmethod
+    def _validate_platform(cls, value: Any) -> Any:
+        return _normalize_platform(value) if isinstance(value, str) else value
+        
+    @field_validator("url", mode="before")
+    @classmethod
+    def _check_url(cls, value: Any) -> Any:
+        # Cheap sanity check; full URL parsing happens once in JobIn at ingest
+        if isinstance(value, str) and not value.startswith(("http://", "https://")):
+            raise ValueError("url must start with http:// or https://")
+        return value
+        
+    @field_validator("employment_type", mode="before")
+    @classmethod
+    def _validate_employment_type(cls, value: Any) -> Any:
+        return _normalize_employment_type(value) if isinstance(value, str) else value
+        
+    @field_validator("experience_level", mode="before")
+    @classmethod
+    def _validate_experience_level(cls, value: Any) -> Any:
+        return _normalize_experience_level(value) if isinstance(value, str) else value
+        
+    @classmethod
+    def from_trusted(cls, **data: Any) -> 'Job':
+        """Build a job from already-validated data without re-validating it
+        
+        Only for trusted sources (our own storage, caches, copies). Values must
+        already have their field types, e.g. `requirements` a list of
+        JobRequirement. Use model_validate for anything else.
+        """
+        return cls.model_construct(**data)
+        
+    @classmethod
+    def from_db_row(cls, row: Dict[str, Any]) -> 'Job':
+        """Rebuild a stored job from a row or decoded JSON document
+        
+        Converts nested requirement dicts, the status string and ISO datetime
+        strings; everything else must already have its field type.
+        """
+        data = dict(row)
+        if "platform" in data:
+            data["platform"] = _intern(data["platform"])
+        status = data.get("status")
+        if status is not None and not isinstance(status, JobStatus):
+            data["status"] = JobStatus(status)
+        parse_datetimes(data, _DATETIME_FIELDS)
+        if data.get("requirements"):
+            data["requirements"] = [
+                JobRequirement.from_trusted(**{
+                    **requirement,
+                    "category": _intern(requirement["category"])
+                }) if isinstance(requirement, dict) else requirement
+                for requirement in data["requirements"]
+            ]
+        return cls.from_trusted(**data)
+        
+    def to_lite(self) -> JobLite:
+        """Get a lightweight read-only copy for scoring/ranking loops"""
+        return JobLite(
+            self.id,
+            self.title,
+            self.company,
+            self.location,
+            self.url,
+            self.platform,
+            self.description,
+            tuple(self.key_skills),
+            tuple(self.keywords),
+            self.match_score
+        )
+        
+    def to_json(self) -> str:
+        """Serialize to a JSON string, omitting None fields"""
+        return self.model_dump_json(exclude_none=True)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Get all fields as a plain dict"""
+        return self.model_dump(mode="python")
+        
+    @classmethod
+    def list_to_json_bytes(cls, jobs: List['Job']) -> bytes:
+        """Serialize many jobs to a JSON array (omitting None fields) in a single call"""
+        return list_adapter(cls).dump_json(jobs, exclude_none=True)
         
     def add_requirement(self, category: str, skill: str, importance: str, years_experience: Optional[int] = None):
         """Add a requirement to the job"""
-        requirement = JobRequirement(
-            category=category,
-            skill=skill,
-            importance=importance,
-            years_experience=years_experience
-        )
+        requirement = acquire_requirement(category, skill, importance, years_experience)
         self.requirements.append(requirement)
+        self._req_cache = None
+        
+    def _partition_requirements(self) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+        """Split requirement skills by importance in a single pass
+        
+        Cached until add_requirement is called or the requirements list is
+        replaced/resized directly.
+        """
+        requirements = self.requirements
+        private = self.__pydantic_private__
+        cache = private["_req_cache"]
+        if (
+            cache is not None
+            and private["_req_cache_src"] is requirements
+            and private["_req_cache_len"] == len(requirements)
+        ):
+            return cache
+            
+        required, preferred, nice = [], [], []
+        for req in requirements:
+            importance = req.importance
+            if importance is RequirementImportance.REQUIRED:
+                required.append(req.skill)
+            elif importance is RequirementImportance.PREFERRED:
+                preferred.append(req.skill)
+            elif importance is RequirementImportance.NICE_TO_HAVE:
+                nice.append(req.skill)
+                
+        cache = private["_req_cache"] = (tuple(required), tuple(preferred), tuple(nice))
+        private["_req_cache_src"] = requirements
+        private["_req_cache_len"] = len(requirements)
+        return cache
         
     def get_required_skills(self) -> List[str]:
         """Get all required skills"""
-        return [req.skill for req in self.requirements if req.importance == "required"]
+        return list(self._partition_requirements()[0])
         
     def get_preferred_skills(self) -> List[str]:
         """Get all preferred skills"""
-        return [req.skill for req in self.requirements if req.importance == "preferred"]
+        return list(self._partition_requirements()[1])
+        
+    def get_nice_to_have_skills(self) -> List[str]:
+        """Get all nice-to-have skills"""
+        return list(self._partition_requirements()[2])
         
     def update_analysis(self, key_skills: List[str], keywords: List[str], match_score: float):
         """Update job analysis results"""
         self.key_skills = key_skills
         self.keywords = keywords
         self.match_score = match_score
-        self.analyzed_at = datetime.now()
+        self.analyzed_at = now()
         self.status = JobStatus.ANALYZED
         
     def mark_applied(self):
         """Mark job as applied"""
-        self.applied_at = datetime.now()
-        self.status = JobStatus.APPLIED 
\ No newline at end of file
+        self.applied_at = now()
+        self.status = JobStatus.APPLIED 
+
+class JobIn(Job):
+    """Job as received from scrapers/the API; fully parses the URL once at ingest"""
+    url: HttpUrl = Field(..., description="Job posting URL")
+    
+    def to_job(self) -> Job:
+        """Convert to the storage model without re-validating"""
+        data = {name: getattr(self, name) for name in Job.model_fields}
+        data["url"] = str(self.url)
+        data["metadata"] = self.metadata_raw
+        return Job.model_construct(self.model_fields_set, **data)
@@ -1,7 +1,14 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+import re
+import sys
+
+from ..utils.time import now
+from .base import LazyMetadataModel, list_adapter
 
 class ResumeTailoringMode(str, Enum):
     """Resume tailoring intensity levels"""
@@ -9,6 +16,50 @@ class ResumeTailoringMode(str, Enum):
     MODERATE = "moderate"
     AGGRESSIVE = "aggressive"
 
+# Skill-like tokens: keeps "C++", "C#", ".NET", "Node.js", "CI/CD", "front-end" whole
+_WORD = re.compile(r"\.?[A-Za-z][A-Za-z0-9+#./-]{0,30}")
+
+# Separators inside a token that may join several terms: "front-end...Vue" is
+# split at the ellipsis first, then "Python/Django" and "Python-based" at / and -
+_ELLIPSIS = re.compile(r"\.{2,}")
+_TOKEN_PARTS = re.compile(r"[/-]")
+
+def _match_token(token: str, index: Dict[str, str], found: Dict[str, None]):
+    """Record the vocabulary term for a token, else for each of its parts"""
+    term = index.get(token)
+    if term is None and token[0] == "." and token[1:2] != ".":
+        # A sentence-ending period glued to the next word ("end.React")
+        term = index.get(token[1:])
+    if term is not None:
+        found[term] = None
+        return
+        
+    if ".." in token:
+        parts = _ELLIPSIS.split(token)
+    elif "/" in token or "-" in token:
+        parts = _TOKEN_PARTS.split(token)
+    else:
+        return
+    for part in parts:
+        part = part.rstrip(".")
+        if part:
+            _match_token(part, index, found)
+
+def _keyword_index(vocabulary: Iterable[str]) -> Tuple[Dict[str, str], int]:
+    """Map lower-cased vocabulary terms to their canonical spelling
+    
+    Multi-word terms are keyed with single spaces between words. Also returns
+    the word count of the longest term, the widest n-gram worth matching.
+    """
+    index = {}
+    max_words = 1
+    for term in vocabulary:
+        words = term.lower().split()
+        if words:
+            index[" ".join(words)] = term
+            max_words = max(max_words, len(words))
+    return index, max_words
+
 class ResumeSection(BaseModel):
     """Individual resume section"""
     id: Optional[str] = Field(None, description="Unique section identifier")
@@ -22,7 +73,91 @@ class ResumeSection(BaseModel):
     tailored_for_job: Optional[str] = Field(None, description="Job ID this section was tailored for")
     tailoring_changes: List[str] = Field(default_factory=list, description="Log of changes made")
     
-class Resume(BaseModel):
+    model_config = ConfigDict(ser_json_timedelta="iso8601", extra="ignore")
+    
+    @classmethod
+    def from_trusted(cls, **data: Any) -> 'ResumeSection':
+        """Build a section from already-validated data without re-validating it"""
+        return cls.model_construct(**data)
+        
+    def extract_keywords(self, vocabulary: Iterable[str]) -> List[str]:
+        """Add the vocabulary terms found in the content to keywords (case-insensitive)
+        
+        Multi-word terms such as "machine learning" match consecutive words.
+        Existing keywords are kept.
+        """
+        return self._match_keywords(*_keyword_index(vocabulary))
+        
+    def _match_keywords(self, index: Dict[str, str], max_words: int) -> List[str]:
+        tokens = [token.rstrip("./-").lower() for token in _WORD.findall(self.content)]
+        found = dict.fromkeys(self.keywords)
+        count = len(tokens)
+        for i, token in enumerate(tokens):
+            _match_token(token, index, found)
+            for width in range(2, min(max_words, count - i) + 1):
+                term = index.get(" ".join(tokens[i:i + width]))
+                if term is not None:
+                    found[term] = None
+                    
+        if len(found) != len(self.keywords):
+            self.keywords = list(found)
+        return self.keywords
+        
+    def to_lite(self) -> 'ResumeSectionLite':
+        """Get a lightweight read-only copy for scoring/ranking loops"""
+        return ResumeSectionLite(self.id, self.title, self.content, self.order, tuple(self.keywords))
+        
+    def to_json(self) -> str:
+        """Serialize to a JSON string, omitting None fields"""
+        return self.model_dump_json(exclude_none=True)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Get all fields as a plain dict"""
+        return self.model_dump(mode="python")
+    
+@dataclass(slots=True, frozen=True)
+class ResumeSectionLite:
+    """Read-only, slotted view of a resume section for retrieval and ranking"""
+    id: Optional[str]
+    title: str
+    content: str
+    order: int
+    keywords: Tuple[str, ...]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the fields as a plain dict (keywords stay a tuple)"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "content": self.content,
+            "order": self.order,
+            "keywords": self.keywords
+        }
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ResumeSectionLite':
+        """Build from a to_dict()/ResumeSection.to_dict() style dict; extra keys are ignored"""
+        return cls(
+            data.get("id"),
+            data["title"],
+            data["content"],
+            data["order"],
+            tuple(data.get("keywords", ()))
+        )
+        
+    def to_model(self) -> ResumeSection:
+        """Convert back to a ResumeSection (tailoring metadata gets its defaults)"""
+        return ResumeSection.from_trusted(
+            id=self.id,
+            title=self.title,
+            content=self.content,
+            order=self.order,
+            keywords=list(self.keywords)
+        )
+    
+_section_title = attrgetter("title")
+
+class Resume(LazyMetadataModel):
     """Resume data model"""
     
     # Basic Information
@@ -55,18 +190,53 @@ class Resume(BaseModel):
     file_path: Optional[str] = Field(None, description="Path to resume file")
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.now, description="When resume was created")
-    updated_at: datetime = Field(default_factory=datetime.now, description="When resume was last updated")
+    created_at: datetime = Field(default_factory=now, description="When resume was created")
+    updated_at: datetime = Field(default_factory=now, description="When resume was last updated")
     version: int = Field(default=1, description="Resume version number")
     
     # Additional context
     context_notes: Optional[str] = Field(None, description="Additional context about work experience")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(ser_json_timedelta="iso8601", extra="ignore")
+    
+    # Lower-cased title -> position in sections (first match), built on demand,
+    # and the section titles it was built from
+    _title_index: Optional[Dict[str, int]] = PrivateAttr(default=None)
+    _title_index_titles: List[str] = PrivateAttr(default_factory=list)
+    
+    # Copies of each section's keywords when skills were last extracted, and the
+    # skills list produced from them
+    _skills_source: Optional[List[List[str]]] = PrivateAttr(default=None)
+    _skills_result: Optional[List[str]] = PrivateAttr(default=None)
+    
+    @field_validator("file_format", mode="before")
+    @classmethod
+    def _intern_file_format(cls, value: Any) -> Any:
+        # Closed vocabulary (pdf, docx, latex): share one string object per value
+        return sys.intern(value) if isinstance(value, str) else value
+        
+    @classmethod
+    def from_trusted(cls, **data: Any) -> 'Resume':
+        """Build a resume from already-validated data without re-validating it
+        
+        Only for trusted sources (our own storage, caches, copies). Values must
+        already have their field types, e.g. `sections` a list of ResumeSection.
+        Use model_validate for anything else.
+        """
+        return cls.model_construct(**data)
+        
+    def to_json(self) -> str:
+        """Serialize to a JSON string, omitting None fields"""
+        return self.model_dump_json(exclude_none=True)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Get all fields as a plain dict"""
+        return self.model_dump(mode="python")
+        
+    @classmethod
+    def list_to_json_bytes(cls, resumes: List['Resume']) -> bytes:
+        """Serialize many resumes to a JSON array (omitting None fields) in a single call"""
+        return list_adapter(cls).dump_json(resumes, exclude_none=True)
         
     def add_section(self, title: str, content: str, order: int = None) -> ResumeSection:
         """Add a new section to the resume"""
@@ -79,65 +249,114 @@ class Resume(BaseModel):
             order=order
         )
         self.sections.append(section)
-        self.updated_at = datetime.now()
+        self._title_index = None
+        self.updated_at = now()
         return section
         
+    def _find_section_index(self, title: str) -> Optional[int]:
+        """Get the position of the first section with the given title (case-insensitive)"""
+        needle = title.lower()
+        sections = self.sections
+        private = self.__pydantic_private__
+        index = private["_title_index"]
+        
+        if index is not None:
+            i = index.get(needle)
+            if i is None:
+                # A miss stands unless a title has changed since the index was built
+                if private["_title_index_titles"] == list(map(_section_title, sections)):
+                    return None
+            elif len(private["_title_index_titles"]) == len(sections) and sections[i].title.lower() == needle:
+                # Trust a hit only if it still points at a matching section
+                return i
+                
+        titles = list(map(_section_title, sections))
+        index = {}
+        for i, section_title in enumerate(titles):
+            index.setdefault(section_title.lower(), i)
+        private["_title_index"] = index
+        private["_title_index_titles"] = titles
+        return index.get(needle)
+        
     def get_section(self, title: str) -> Optional[ResumeSection]:
         """Get a section by title"""
-        for section in self.sections:
-            if section.title.lower() == title.lower():
-                return section
-        return None
+        i = self._find_section_index(title)
+        return self.sections[i] if i is not None else None
         
     def update_section(self, title: str, content: str) -> bool:
         """Update a section's content"""
         section = self.get_section(title)
         if section:
             section.content = content
-            self.updated_at = datetime.now()
+            self.updated_at = now()
             return True
         return False
         
     def remove_section(self, title: str) -> bool:
         """Remove a section by title"""
-        for i, section in enumerate(self.sections):
-            if section.title.lower() == title.lower():
-                del self.sections[i]
-                self.updated_at = datetime.now()
-                return True
-        return False
+        i = self._find_section_index(title)
+        if i is None:
+            return False
+            
+        del self.sections[i]
+        self._title_index = None
+        self.updated_at = now()
+        return True
         
     def reorder_sections(self, new_order: List[str]) -> bool:
-        """Reorder sections based on title list"""
+        """Reorder sections based on title list (case-insensitive)"""
         if len(new_order) != len(self.sections):
             return False
             
-        section_map = {section.title: section for section in self.sections}
-        reordered_sections = []
-        
-        for i, title in enumerate(new_order):
-            if title in section_map:
-                section = section_map[title]
-                section.order = i + 1
-                reordered_sections.append(section)
-            else:
+        order_map = {title.lower(): i + 1 for i, title in enumerate(new_order)}
+        
+        # Resolve every position before touching anything so a bad title
+        # leaves the resume unchanged
+        orders = []
+        for section in self.sections:
+            order = order_map.get(section.title.lower())
+            if order is None:
                 return False
-                
-        self.sections = reordered_sections
-        self.updated_at = datetime.now()
+            orders.append(order)
+            
+        for section, order in zip(self.sections, orders):
+            section.order = order
+        self.sections.sort(key=lambda section: section.order)
+        self._title_index = None
+        self.updated_at = now()
         return True
         
+    def extract_keywords(self, vocabulary: Iterable[str]) -> List[str]:
+        """Extract every section's keywords against a skill vocabulary
+        
+        Returns the merged skills, as extract_skills does.
+        """
+        index, max_words = _keyword_index(vocabulary)
+        for section in self.sections:
+            section._match_keywords(index, max_words)
+        return self.extract_skills()
+        
     def extract_skills(self) -> List[str]:
         """Extract all skills mentioned in the resume"""
+        # Skip the union when every section's keywords still equal the snapshot
+        # taken last time and skills is still the list built from them
+        keywords = [section.keywords for section in self.sections]
+        private = self.__pydantic_private__
+        if private["_skills_result"] is self.skills and private["_skills_source"] == keywords:
+            return self.skills
+            
         skills = set()
-        for section in self.sections:
-            skills.update(section.keywords)
+        for section_keywords in keywords:
+            skills.update(section_keywords)
         self.skills = list(skills)
+        private["_skills_source"] = [section_keywords.copy() for section_keywords in keywords]
+        private["_skills_result"] = self.skills
         return self.skills
         
     def create_tailored_copy(self, job_id: str, tailoring_mode: ResumeTailoringMode) -> 'Resume':
         """Create a tailored copy of this resume"""
-        tailored_resume = Resume(
+        # Every value comes from this already-validated resume, so skip validation
+        tailored_resume = Resume.from_trusted(
             title=f"{self.title} - Tailored for {job_id}",
             owner_name=self.owner_name,
             email=self.email,
@@ -145,7 +364,19 @@ class Resume(BaseModel):
             location=self.location,
             linkedin_url=self.linkedin_url,
             portfolio_url=self.portfolio_url,
-            sections=[section.copy() for section in self.sections],
+            sections=[
+                ResumeSection.from_trusted(
+                    id=section.id,
+                    title=section.title,
+                    content=section.content,
+                    order=section.order,
+                    keywords=section.keywords.copy(),
+                    original_content=section.content,
+                    tailored_for_job=job_id,
+                    tailoring_changes=[]
+                )
+                for section in self.sections
+            ],
             skills=self.skills.copy(),
             keywords=self.keywords.copy(),
             is_tailored=True,
@@ -154,14 +385,9 @@ class Resume(BaseModel):
             original_resume_id=self.id,
             file_format=self.file_format,
             context_notes=self.context_notes,
-            metadata=self.metadata.copy()
+            metadata=self.metadata_raw
         )
         
-        # Store original content for tracking changes
-        for section in tailored_resume.sections:
-            section.original_content = section.content
-            section.tailored_for_job = job_id
-            
         return tailored_resume
         
     def get_tailoring_summary(self) -> Dict[str, Any]:
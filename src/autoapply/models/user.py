@@ -1,13 +1,22 @@
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from pydantic import ConfigDict, Field, EmailStr, PrivateAttr, field_validator
+from typing import List, Optional, Dict, Any, Mapping, Set, Tuple
 from datetime import datetime
 
-class UserProfile(BaseModel):
+from ..utils.time import now
+from .base import CachedSummaryModel, LazyMetadataModel, parse_datetimes
+
+def _check_email(value: Any) -> Any:
+    # Cheap sanity check; full address validation happens once in the *In models
+    if isinstance(value, str) and "@" not in value:
+        raise ValueError("email must contain '@'")
+    return value
+
+class UserProfile(LazyMetadataModel, CachedSummaryModel):
     """User profile with preferences and settings"""
     
     # Personal Information
     name: str = Field(..., description="User's full name")
-    email: EmailStr = Field(..., description="User's email address")
+    email: str = Field(..., description="User's email address")
     phone: Optional[str] = Field(None, description="User's phone number")
     location: Optional[str] = Field(None, description="User's current location")
     
@@ -43,34 +52,74 @@ class UserProfile(BaseModel):
     career_goals: Optional[str] = Field(None, description="Career goals and aspirations")
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.now, description="When profile was created")
-    updated_at: datetime = Field(default_factory=datetime.now, description="When profile was last updated")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    created_at: datetime = Field(default_factory=now, description="When profile was created")
+    updated_at: datetime = Field(default_factory=now, description="When profile was last updated")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(ser_json_timedelta="iso8601", extra="ignore")
+    
+    # Field name -> (list it mirrors, that list's length, set of its companies)
+    _company_sets: Dict[str, Tuple[List[str], int, Set[str]]] = PrivateAttr(default_factory=dict)
+    
+    @field_validator("email", mode="before")
+    @classmethod
+    def _validate_email(cls, value: Any) -> Any:
+        return _check_email(value)
+        
+    @classmethod
+    def from_trusted(cls, **data: Any) -> 'UserProfile':
+        """Build a profile from already-validated data without re-validating it
+        
+        Only for trusted sources; `email` must already be a validated address.
+        """
+        return cls.model_construct(**data)
+        
+    def to_json(self) -> str:
+        """Serialize to a JSON string, omitting None fields"""
+        return self.model_dump_json(exclude_none=True)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Get all fields as a plain dict"""
+        return self.model_dump(mode="python")
         
     def update_skills(self, new_skills: List[str]):
         """Update user skills"""
-        self.skills = list(set(self.skills + new_skills))
-        self.updated_at = datetime.now()
+        current = set(self.skills)
+        merged = current.union(new_skills)
+        # Also rewrite when skills holds duplicates, as a full rebuild would
+        if merged != current or len(current) != len(self.skills):
+            self.skills = list(merged)
+            self.updated_at = now()
+        
+    def _add_company(self, field_name: str, company: str) -> bool:
+        """Append company to a company list field unless already present
+        
+        Membership is checked against a set mirroring the list, rebuilt only
+        when the list was replaced or resized outside this method.
+        """
+        companies: List[str] = getattr(self, field_name)
+        company_sets = self.__pydantic_private__["_company_sets"]
+        source, size, members = company_sets.get(field_name, (None, 0, None))
+        if source is not companies or size != len(companies):
+            members = set(companies)
+            
+        added = company not in members
+        if added:
+            members.add(company)
+            companies.append(company)
+        company_sets[field_name] = (companies, len(companies), members)
+        return added
         
     def add_target_company(self, company: str):
         """Add a target company"""
-        if company not in self.target_companies:
-            self.target_companies.append(company)
-            self.updated_at = datetime.now()
+        if self._add_company("target_companies", company):
+            self.updated_at = now()
             
     def exclude_company(self, company: str):
         """Add a company to exclusion list"""
-        if company not in self.excluded_companies:
-            self.excluded_companies.append(company)
-            self.updated_at = datetime.now()
+        if self._add_company("excluded_companies", company):
+            self.updated_at = now()
             
-    def get_profile_summary(self) -> Dict[str, Any]:
-        """Get profile summary"""
+    def _build_summary(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "current_title": self.current_title,
@@ -81,14 +130,22 @@ class UserProfile(BaseModel):
             "auto_apply_enabled": self.auto_apply_enabled,
             "max_applications_per_day": self.max_applications_per_day
         }
+        
+    def get_profile_summary(self) -> Mapping[str, Any]:
+        """Get profile summary"""
+        summary = self.summary
+        # skills may have been appended to in place, which bypasses __setattr__
+        if summary["skills_count"] != len(self.skills):
+            summary = self._rebuild_summary()
+        return summary
 
-class User(BaseModel):
+class User(CachedSummaryModel):
     """Main user model"""
     
     # Basic Information
     id: Optional[str] = Field(None, description="Unique user identifier")
     username: str = Field(..., description="Username")
-    email: EmailStr = Field(..., description="User's email address")
+    email: str = Field(..., description="User's email address")
     
     # Profile
     profile: UserProfile = Field(..., description="User profile information")
@@ -103,27 +160,57 @@ class User(BaseModel):
     successful_applications: int = Field(default=0, description="Applications that led to interviews")
     
     # Dates
-    created_at: datetime = Field(default_factory=datetime.now, description="When user was created")
+    created_at: datetime = Field(default_factory=now, description="When user was created")
     last_login: Optional[datetime] = Field(None, description="Last login timestamp")
     last_application: Optional[datetime] = Field(None, description="Last application timestamp")
     
     # Settings
     settings: Dict[str, Any] = Field(default_factory=dict, description="User-specific settings")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(ser_json_timedelta="iso8601", extra="ignore")
+    
+    @field_validator("email", mode="before")
+    @classmethod
+    def _validate_email(cls, value: Any) -> Any:
+        return _check_email(value)
+        
+    @classmethod
+    def from_trusted(cls, **data: Any) -> 'User':
+        """Build a user from already-validated data without re-validating it
+        
+        Only for trusted sources; `email` must already be a validated address and
+        `profile` a UserProfile. Use model_validate for anything else.
+        """
+        return cls.model_construct(**data)
+        
+    @classmethod
+    def from_cache(cls, doc: Dict[str, Any]) -> 'User':
+        """Rebuild a cached user, converting a nested profile dict and ISO datetime strings"""
+        data = dict(doc)
+        parse_datetimes(data, ("created_at", "last_login", "last_application"))
+        if isinstance(data.get("profile"), dict):
+            profile = dict(data["profile"])
+            parse_datetimes(profile, ("created_at", "updated_at"))
+            data["profile"] = UserProfile.from_trusted(**profile)
+        return cls.from_trusted(**data)
+        
+    def to_json(self) -> str:
+        """Serialize to a JSON string, omitting None fields"""
+        return self.model_dump_json(exclude_none=True)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Get all fields as a plain dict"""
+        return self.model_dump(mode="python")
         
     def update_login(self):
         """Update last login timestamp"""
-        self.last_login = datetime.now()
+        self.last_login = now()
         
     def record_application(self, successful: bool = False):
         """Record a new application"""
         self.total_applications += 1
         self.applications_this_month += 1
-        self.last_application = datetime.now()
+        self.last_application = now()
         
         if successful:
             self.successful_applications += 1
@@ -140,8 +227,7 @@ class User(BaseModel):
         # For now, return True
         return True
         
-    def get_user_summary(self) -> Dict[str, Any]:
-        """Get user summary statistics"""
+    def _build_summary(self) -> Dict[str, Any]:
         return {
             "username": self.username,
             "email": self.email,
@@ -153,4 +239,33 @@ class User(BaseModel):
             "last_login": self.last_login,
             "last_application": self.last_application,
             "profile_summary": self.profile.get_profile_summary()
-        } 
\ No newline at end of file
+        }
+        
+    def get_user_summary(self) -> Mapping[str, Any]:
+        """Get user summary statistics"""
+        summary = self.summary
+        # The profile is mutated on its own; rebuild if its summary was
+        if summary["profile_summary"] is not self.profile.get_profile_summary():
+            summary = self._rebuild_summary()
+        return summary
+
+class UserProfileIn(UserProfile):
+    """Profile as received from the API; fully validates the email once at ingest"""
+    email: EmailStr = Field(..., description="User's email address")
+    
+    def to_profile(self) -> UserProfile:
+        """Convert to the storage model without re-validating"""
+        data = {name: getattr(self, name) for name in UserProfile.model_fields}
+        data["metadata"] = self.metadata_raw
+        return UserProfile.model_construct(self.model_fields_set, **data)
+
+class UserIn(User):
+    """User as received from the API; fully validates emails once at ingest"""
+    email: EmailStr = Field(..., description="User's email address")
+    profile: UserProfileIn = Field(..., description="User profile information")
+    
+    def to_user(self) -> User:
+        """Convert to the storage model without re-validating"""
+        data = {name: getattr(self, name) for name in User.model_fields}
+        data["profile"] = self.profile.to_profile()
+        return User.model_construct(self.model_fields_set, **data)
@@ -0,0 +1,7 @@
+from .time import now, frozen_now
+
+__all__ = [
+    # Clock helpers
+    "now",
+    "frozen_now",
+]
@@ -0,0 +1,28 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator, Optional
+
+# Timestamp returned by now() while inside a frozen_now() block
+_now_override: ContextVar[Optional[datetime]] = ContextVar("now_override", default=None)
+
+def now() -> datetime:
+    """Get the current time, or the shared timestamp inside frozen_now()"""
+    override = _now_override.get()
+    return override if override is not None else datetime.now()
+
+@contextmanager
+def frozen_now(timestamp: Optional[datetime] = None) -> Iterator[datetime]:
+    """Make every now() call in the block (and its tasks) return one timestamp
+    
+    Meant for request handlers and batch jobs, which read the clock once:
+    
+        with frozen_now():
+            for resume in resumes:
+                resume.add_section(...)
+    """
+    token = _now_override.set(timestamp or datetime.now())
+    try:
+        yield _now_override.get()
+    finally:
+        _now_override.reset(token)
@@ -0,0 +1,47 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# Load agents/base.py on its own; the package __init__ also imports every agent
+_BASE = Path(__file__).resolve().parent.parent / "src" / "autoapply" / "agents" / "base.py"
+_spec = importlib.util.spec_from_file_location("autoapply_agents_base", _BASE)
+base = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(base)
+
+class EvenAgent(base.AsyncAgent):
+    """Accepts ints, succeeds on even ones and raises on multiples of 3"""
+
+    def validate_input(self, input_data):
+        return isinstance(input_data, int)
+        
+    async def execute(self, input_data):
+        await asyncio.sleep(0)
+        if input_data % 3 == 0:
+            raise RuntimeError("boom")
+        if input_data % 2:
+            return base.AgentResult.failure_result("odd")
+        return base.AgentResult.success_result(input_data)
+
+def test_execute_parallel_rejects_non_positive_concurrency():
+    with pytest.raises(ValueError):
+        asyncio.run(EvenAgent("even").execute_parallel([2], max_concurrency=0))
+        
+def test_execute_parallel_records_one_batch():
+    agent = EvenAgent("even")
+    results = asyncio.run(agent.execute_parallel([2, 4, 5, 6], max_concurrency=2))
+    assert [result.success for result in results] == [True, True, False, False]
+    assert [result.error for result in results[2:]] == ["odd", "boom"]
+    assert agent.status is base.AgentStatus.FAILED
+
+    history = agent.get_execution_history()
+    assert len(history) == 1
+    assert history[0]["error"] == "2 of 4 tasks failed"
+    assert history[0]["metadata"] == {"total_tasks": 4, "successful_tasks": 2, "failed_tasks": 2}
+
+def test_execute_parallel_times_invalid_input():
+    results = asyncio.run(EvenAgent("even").execute_parallel(["x", 2]))
+    assert results[0].error == "Invalid input data"
+    assert results[0].execution_time > 0
+    assert results[1].success
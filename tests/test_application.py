@@ -0,0 +1,28 @@
+import pytest
+
+from autoapply.models import Application
+from autoapply.models.application import ApplicationFormData
+
+def make_application() -> Application:
+    return Application(job_id="job-1", resume_id="resume-1", platform="linkedin")
+
+def test_same_length_form_data_replacement_refreshes_dict():
+    application = make_application()
+    application.add_form_data("name", "Ada")
+    assert application.get_form_data_dict() == {"name": "Ada"}
+    application.form_data = [ApplicationFormData("email", "ada@example.com")]
+    assert application.get_form_data_dict() == {"email": "ada@example.com"}
+
+def test_add_form_data_updates_cached_dict():
+    application = make_application()
+    application.add_form_data("name", "Ada")
+    application.get_form_data_dict()
+    application.add_form_data("email", "ada@example.com")
+    assert application.get_form_data_dict() == {"name": "Ada", "email": "ada@example.com"}
+
+def test_form_data_dict_is_read_only():
+    application = make_application()
+    application.add_form_data("name", "Ada")
+    with pytest.raises(TypeError):
+        application.get_form_data_dict()["name"] = "Grace"
+    assert application.get_form_data_dict() == {"name": "Ada"}
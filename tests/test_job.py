@@ -0,0 +1,39 @@
+import json
+
+from autoapply.models import Job, JobRequirement, RequirementImportance
+
+def make_job(**data) -> Job:
+    return Job(
+        title="Engineer", company="Acme", location="Remote", description="...",
+        url="https://example.com/job", platform="linkedin", **data
+    )
+
+def requirement(skill: str, importance: str = "required") -> JobRequirement:
+    return JobRequirement(category="technical", skill=skill, importance=importance)
+
+def test_replaced_requirements_list_refreshes_partition():
+    job = make_job()
+    for skill in ("python", "go", "rust", "java"):
+        # Same length each time; the freed list's id() is often reused
+        job.requirements = [requirement(skill)]
+        assert job.get_required_skills() == [skill]
+
+def test_add_requirement_refreshes_partition():
+    job = make_job(requirements=[requirement("python")])
+    assert job.get_required_skills() == ["python"]
+    job.add_requirement("technical", "docker", "preferred")
+    assert job.get_preferred_skills() == ["docker"]
+
+def test_from_trusted_coerces_plain_string_importance():
+    req = JobRequirement.from_trusted(category="t", skill="go", importance="required")
+    assert req.importance is RequirementImportance.REQUIRED
+    job = make_job()
+    job.requirements = [req, JobRequirement.from_trusted(category="t", skill="sql", importance="nice-to-have")]
+    assert job.get_required_skills() == ["go"]
+    assert job.get_nice_to_have_skills() == ["sql"]
+
+def test_from_db_row_round_trips_json():
+    job = make_job(requirements=[requirement("python"), requirement("docker", "preferred")])
+    restored = Job.from_db_row(json.loads(job.to_json()))
+    assert restored == job
+    assert restored.get_preferred_skills() == ["docker"]
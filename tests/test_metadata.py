@@ -0,0 +1,34 @@
+from autoapply.models import Job, UserProfile
+
+def make_profile(**data) -> UserProfile:
+    return UserProfile(name="Ada", email="ada@example.com", **data)
+
+def test_metadata_round_trips_through_json():
+    profile = make_profile(metadata={"source": "import", "tags": ["a"]})
+    restored = UserProfile.model_validate_json(profile.model_dump_json())
+    assert restored.metadata == {"source": "import", "tags": ["a"]}
+
+def test_equality_ignores_metadata_key_order():
+    profile = make_profile(metadata={"a": 1, "b": 2})
+    other = profile.model_copy()
+    other.metadata = {"b": 2, "a": 1}
+    assert profile == other
+    other.metadata = {"a": 1}
+    assert profile != other
+
+def test_equality_ignores_decoded_metadata_cache():
+    profile = make_profile(metadata={"a": 1})
+    other = profile.model_copy(deep=True)
+    profile.metadata_get("a")
+    assert profile == other
+
+def test_model_copy_applies_metadata_update():
+    profile = make_profile(metadata={"a": 1})
+    copied = profile.model_copy(update={"metadata": {"b": 2}})
+    assert copied.metadata == {"b": 2}
+    assert "metadata" not in copied.__dict__
+    assert copied.model_dump()["metadata"] == {"b": 2}
+    assert profile.metadata == {"a": 1}
+
+def test_validation_schema_documents_metadata():
+    assert "metadata" in Job.model_json_schema(mode="validation")["properties"]
@@ -0,0 +1,36 @@
+from autoapply.models import Resume
+
+def make_resume() -> Resume:
+    resume = Resume(title="Resume", owner_name="Ada", email="ada@example.com")
+    resume.add_section("Summary", "Engineer")
+    resume.add_section("Skills", "Python")
+    return resume
+
+def test_extract_skills_sees_replaced_keyword_lists():
+    resume = make_resume()
+    section = resume.get_section("skills")
+    for skill in ("Python", "Go", "Rust"):
+        # Same length each time; the freed list's id() is often reused
+        section.keywords = [skill]
+        assert resume.extract_skills() == [skill]
+
+def test_extract_skills_sees_in_place_keyword_edits():
+    resume = make_resume()
+    section = resume.get_section("skills")
+    section.keywords = ["Python"]
+    assert resume.extract_skills() == ["Python"]
+    section.keywords[0] = "Go"
+    assert resume.extract_skills() == ["Go"]
+
+def test_get_section_after_rename():
+    resume = make_resume()
+    assert resume.get_section("experience") is None
+    resume.get_section("skills").title = "Experience"
+    assert resume.get_section("experience") is resume.sections[1]
+    assert resume.get_section("skills") is None
+
+def test_get_section_after_sections_replaced():
+    resume = make_resume()
+    assert resume.get_section("summary") is resume.sections[0]
+    resume.sections = list(reversed(resume.sections))
+    assert resume.get_section("summary") is resume.sections[1]
@@ -0,0 +1,41 @@
+from autoapply.models import Resume, ResumeSection
+
+VOCABULARY = ["Python", "Machine Learning", "C++", "Node.js", "CI/CD", "natural language processing"]
+
+def make_section(content: str, keywords=None) -> ResumeSection:
+    return ResumeSection(title="Experience", content=content, order=1, keywords=keywords or [])
+
+def test_single_word_terms_match_case_insensitively():
+    section = make_section("Built services in python and C++, deployed with ci/cd.")
+    assert section.extract_keywords(VOCABULARY) == ["Python", "C++", "CI/CD"]
+
+def test_multi_word_terms_match_consecutive_words():
+    section = make_section("Experienced in Machine Learning and Natural  Language Processing.")
+    assert section.extract_keywords(VOCABULARY) == ["Machine Learning", "natural language processing"]
+
+def test_multi_word_terms_need_adjacent_words():
+    section = make_section("Machine operator, learning Python")
+    assert section.extract_keywords(VOCABULARY) == ["Python"]
+
+def test_joined_terms_match_each_part():
+    vocabulary = ["Python", "Django", "HTML", "CSS", "AWS", "GCP", ".NET", "React"]
+    section = make_section("Stack: Python/Django, HTML/CSS, AWS/GCP; Python-based tooling; .NET; React.")
+    assert section.extract_keywords(vocabulary) == vocabulary
+
+def test_whole_token_is_preferred_over_its_parts():
+    vocabulary = ["CI/CD", "front-end", "Vue", "Node.js", "TypeScript"]
+    section = make_section("CI/CD and front-end...Vue; Node.js/TypeScript.")
+    assert section.extract_keywords(vocabulary) == vocabulary
+
+def test_existing_keywords_are_kept():
+    section = make_section("Machine learning with Python", keywords=["Leadership"])
+    assert section.extract_keywords(VOCABULARY) == ["Leadership", "Machine Learning", "Python"]
+    assert section.extract_keywords(VOCABULARY) == ["Leadership", "Machine Learning", "Python"]
+
+def test_resume_extract_keywords_merges_sections():
+    resume = Resume(title="Resume", owner_name="Me", email="me@example.com")
+    resume.add_section("Summary", "Machine learning engineer")
+    resume.add_section("Skills", "Python, Node.js")
+    skills = resume.extract_keywords(VOCABULARY)
+    assert sorted(skills) == ["Machine Learning", "Node.js", "Python"]
+    assert resume.get_section("skills").keywords == ["Python", "Node.js"]
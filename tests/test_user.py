@@ -0,0 +1,59 @@
+import json
+import warnings
+
+import pytest
+
+from autoapply.models import User, UserProfile
+
+def make_profile(**data) -> UserProfile:
+    return UserProfile(name="Ada", email="ada@example.com", **data)
+
+def test_replaced_company_list_refreshes_membership():
+    profile = make_profile()
+    for company in ("Acme", "Globex", "Initech"):
+        # Same length each time; the freed list's id() is often reused
+        profile.excluded_companies = [company]
+        profile.exclude_company("Acme")
+        assert profile.excluded_companies.count("Acme") == 1
+
+def test_update_skills_drops_duplicates():
+    profile = make_profile(skills=["python", "python"])
+    profile.update_skills(["python"])
+    assert profile.skills == ["python"]
+
+def test_update_skills_merges_new_skills():
+    profile = make_profile(skills=["python"])
+    profile.update_skills(["go", "python"])
+    assert sorted(profile.skills) == ["go", "python"]
+
+def test_profile_summary_is_shared_and_read_only():
+    profile = make_profile()
+    summary = profile.get_profile_summary()
+    assert profile.get_profile_summary() is summary
+    with pytest.raises(TypeError):
+        summary["name"] = "Grace"
+
+def test_profile_summary_follows_changes():
+    profile = make_profile()
+    profile.get_profile_summary()
+    profile.skills.append("python")
+    assert profile.get_profile_summary()["skills_count"] == 1
+    profile.name = "Grace"
+    assert profile.get_profile_summary()["name"] == "Grace"
+    assert profile.model_copy(update={"name": "Ada L."}).get_profile_summary()["name"] == "Ada L."
+
+def test_user_summary_follows_profile_changes():
+    user = User(username="ada", email="ada@example.com", profile=make_profile())
+    assert user.get_user_summary()["profile_summary"]["skills_count"] == 0
+    user.profile.update_skills(["python"])
+    assert user.get_user_summary()["profile_summary"]["skills_count"] == 1
+
+def test_from_cache_restores_datetimes():
+    user = User(username="ada", email="ada@example.com", profile=make_profile())
+    user.update_login()
+    restored = User.from_cache(json.loads(user.to_json()))
+    assert restored == user
+    with warnings.catch_warnings():
+        # Serializing str-typed datetimes would warn
+        warnings.simplefilter("error")
+        assert restored.to_json() == user.to_json()